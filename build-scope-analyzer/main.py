@@ -14,10 +14,89 @@ import argparse
 import fnmatch
 import yaml
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple, Any
 
 
+@dataclass(slots=True)
+class DockerfileInfo:
+    """A Dockerfile found in, or deleted from, an app folder"""
+    path: str
+    name: str
+    suffix: str  # e.g. "sidecar" for "Dockerfile.sidecar", empty for "Dockerfile"
+
+    @classmethod
+    def from_path(cls, path: Path) -> 'DockerfileInfo':
+        name = path.name
+        suffix = '' if name == 'Dockerfile' else name.replace('Dockerfile.', '')
+        return cls(sys.intern(str(path)), sys.intern(name), sys.intern(suffix))
+
+    def to_dict(self) -> Dict[str, str]:
+        return {'path': self.path, 'name': self.name, 'suffix': self.suffix}
+
+
+@dataclass(slots=True)
+class Container:
+    """A container image built from a single Dockerfile"""
+    path: str
+    context: str
+    app_name: str
+    dockerfile: DockerfileInfo
+    container_name: str
+
+    def to_matrix_item(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'context': self.context,
+            'app_name': self.app_name,
+            'dockerfile': self.dockerfile.to_dict(),
+            'container_name': self.container_name
+        }
+
+    def to_deleted_item(self, commit_sha: Optional[str] = None) -> Dict[str, Any]:
+        item = {
+            'app_name': self.app_name,
+            'container_name': self.container_name,
+            'dockerfile': self.dockerfile.path
+        }
+        if commit_sha:
+            item['commit_sha'] = commit_sha
+        return item
+
+
+@dataclass(slots=True)
+class App:
+    """An app folder with its optional app config and containers"""
+    path: str
+    app_name: str
+    app_config: Optional[str]
+    containers: List[Container] = field(default_factory=list)
+    changed_files: Tuple[str, ...] = ()
+    in_scope: bool = False  # Matched by the include pattern (apps.all / containers.all)
+    updated: bool = False  # Has changes that are not only renames (apps.updated / containers.updated)
+
+    def to_matrix_item(self, commit_sha: Optional[str] = None) -> Dict[str, Any]:
+        item = {
+            'path': self.path,
+            'app_name': self.app_name,
+            'app_config': self.app_config
+        }
+        if commit_sha:
+            item['commit_sha'] = commit_sha
+        return item
+
+
+@dataclass(slots=True)
+class Inventory:
+    """Every app and container relevant to one run, built once and filtered into views"""
+    apps: Dict[str, App]  # Keyed by folder path
+    deleted_apps: List[App]
+    deleted_containers: List[Container]
+    ref: str
+    commit_sha: Optional[str]
+
+
 class BuildScopeAnalyzer:
     """Analyzes git changes and generates strategy matrix output"""
 
@@ -29,6 +108,7 @@ class BuildScopeAnalyzer:
         self.deleted_files: Set[Path] = set()
         self.renamed_files: Dict[Path, Path] = {}  # old_path -> new_path
         self.mock_git = mock_git  # Flag to enable mock mode for local testing
+        self._yaml_names: Dict[str, Optional[str]] = {}  # app config path -> 'name' property
 
     def run_git_command(self, cmd: List[str]) -> str:
         """Execute a git command and return output"""
@@ -96,10 +176,8 @@ class BuildScopeAnalyzer:
             except:
                 return ref_name, None
 
-    def get_changed_files(self) -> Tuple[Set[Path], Set[Path], Dict[Path, Path]]:
-        """Get list of changed, deleted, and renamed files from git diff"""
-        ref_name, commit_sha = self.get_comparison_ref()
-
+    def get_changed_files(self, ref_name: str) -> Tuple[Set[Path], Set[Path], Dict[Path, Path]]:
+        """Get list of changed, deleted, and renamed files from git diff against ref_name"""
         # If ref is empty (workflow_dispatch), return empty sets
         if not ref_name:
             return set(), set(), {}
@@ -150,29 +228,16 @@ class BuildScopeAnalyzer:
 
         return True
 
-    def find_dockerfiles(self, folder: Path) -> List[Dict[str, str]]:
+    def find_dockerfiles(self, folder: Path) -> List[DockerfileInfo]:
         """Find all Dockerfiles in a folder and return info about them"""
-        dockerfiles = []
         full_folder = self.root_path / folder
 
         # Look for all files starting with "Dockerfile"
-        for file in full_folder.glob("Dockerfile*"):
-            if file.is_file():
-                dockerfile_info = {
-                    'path': str(folder / file.name),
-                    'name': file.name
-                }
-
-                # Determine the container name based on Dockerfile name
-                if file.name == "Dockerfile":
-                    dockerfile_info['suffix'] = ''
-                else:
-                    # Extract suffix (e.g., "sidecar" from "Dockerfile.sidecar")
-                    dockerfile_info['suffix'] = file.name.replace("Dockerfile.", "")
-
-                dockerfiles.append(dockerfile_info)
-
-        return dockerfiles
+        return [
+            DockerfileInfo.from_path(folder / file.name)
+            for file in full_folder.glob("Dockerfile*")
+            if file.is_file()
+        ]
 
     def find_app_yaml(self, folder: Path) -> Optional[str]:
         """Check if app.yaml or app.yml exists in folder"""
@@ -181,16 +246,20 @@ class BuildScopeAnalyzer:
         for config_name in ['app.yaml', 'app.yml']:
             config_path = full_folder / config_name
             if config_path.exists():
-                return str(folder / config_name)
+                return sys.intern(str(folder / config_name))
 
         return None
 
-    def analyze_deletions(self) -> Dict[str, Any]:
-        """Analyze deleted files to determine what cleanup is needed"""
-        deletions = {
-            'apps': [],  # Apps that need terraform destroy
-            'containers': [],  # Container images that need ACR cleanup
-        }
+    def analyze_deletions(self) -> Tuple[List[App], List[Container]]:
+        """Analyze deleted files to determine what cleanup is needed
+
+        Returns:
+            Tuple containing:
+                - apps: Apps that need terraform destroy
+                - containers: Container images that need ACR cleanup
+        """
+        deleted_apps: List[App] = []
+        deleted_containers: List[Container] = []
 
         # Group deletions by folder
         deleted_by_folder: Dict[Path, Dict[str, List[Path]]] = {}
@@ -217,93 +286,46 @@ class BuildScopeAnalyzer:
 
         # Process deletions
         for folder_path, deleted_items in deleted_by_folder.items():
+            path = sys.intern(str(folder_path))
             app_name = folder_path.name
 
+            # Use the deleted app.yaml/app.yml, if any, for the app config and container naming
+            deleted_config = None
+            if deleted_items['app_configs']:
+                deleted_config = sys.intern(str(deleted_items['app_configs'][0]))
+
             # Check if the folder itself was deleted
             if not (self.root_path / folder_path).exists():
                 # Folder was deleted - add to deleted_apps
-                # For consistent structure with apps.all and apps.updated, construct the expected app.yaml path
-                yaml_path = str(folder_path / 'app.yaml')  # Default to app.yaml path
-                # Check if we had app.yaml or app.yml in the deleted files
-                for app_config in deleted_items['app_configs']:
-                    yaml_path = str(app_config)
-                    break
-
-                deletions['apps'].append({
-                    'path': str(folder_path),
-                    'app_name': app_name,
-                    'app_config': yaml_path
-                })
-
-                # Also need to determine what containers were in this folder
-                # Since the folder is gone, we need to infer from deleted files
-                for dockerfile in deleted_items['dockerfiles']:
-                    dockerfile_name = dockerfile.name
-                    # Create a dockerfile dict similar to what other methods use
-                    dockerfile_dict = {'name': dockerfile_name}
-                    if dockerfile_name == 'Dockerfile':
-                        dockerfile_dict['suffix'] = ''
-                    else:
-                        dockerfile_dict['suffix'] = dockerfile_name.replace('Dockerfile.', '')
-
-                    # Try to find app.yaml/app.yml in the deleted files to get app name
-                    app_config_path = None
-                    for app_config in deleted_items['app_configs']:
-                        app_config_path = str(app_config)
-                        break
-
-                    # Use our standard method for consistent container naming
-                    container_name = self.get_container_name(app_name, dockerfile_dict, app_config_path)
+                # For consistent structure with apps.all and apps.updated, default to the app.yaml path
+                app_config = deleted_config or sys.intern(str(folder_path / 'app.yaml'))
+                deleted_apps.append(App(path, app_name, app_config))
 
-                    deletions['containers'].append({
-                        'app_name': app_name,
-                        'container_name': container_name,
-                        'dockerfile': str(dockerfile)
-                    })
+                # Since the folder is gone, containers are inferred from the deleted files
+                naming_config = deleted_config
             else:
                 # Folder still exists - handle partial deletions
                 # If app.yaml was deleted, the app needs to be destroyed
-                if deleted_items['app_configs']:
-                    deletions['apps'].append({
-                        'path': str(folder_path),
-                        'app_name': app_name,
-                        'app_config': str(deleted_items['app_configs'][0])  # Consistent with apps.all and apps.updated
-                    })
-
-                # Track deleted containers (Dockerfiles)
-                for dockerfile in deleted_items['dockerfiles']:
-                    dockerfile_name = dockerfile.name
-                    # Create a dockerfile dict similar to what other methods use
-                    dockerfile_dict = {'name': dockerfile_name}
-                    if dockerfile_name == 'Dockerfile':
-                        dockerfile_dict['suffix'] = ''
-                    else:
-                        dockerfile_dict['suffix'] = dockerfile_name.replace('Dockerfile.', '')
-
-                    # Find app.yaml or app.yml in the deleted files
-                    app_config_path = None
-                    for app_config in deleted_items['app_configs']:
-                        app_config_path = str(app_config)
-                        break
-
-                    # If the folder wasn't deleted, check if app.yaml/app.yml still exists
-                    if not app_config_path:
-                        potential_app_yaml = self.find_app_yaml(folder_path)
-                        if potential_app_yaml:
-                            app_config_path = potential_app_yaml
-
-                    # Use our standard method for consistent container naming
-                    container_name = self.get_container_name(app_name, dockerfile_dict, app_config_path)
-
-                    deletions['containers'].append({
-                        'app_name': app_name,
-                        'container_name': container_name,
-                        'dockerfile': str(dockerfile)
-                    })
-
-        return deletions
-
-    def analyze_folder(self, folder: Path, changed_files: Set[Path]) -> Optional[Dict]:
+                if deleted_config:
+                    deleted_apps.append(App(path, app_name, deleted_config))
+
+                # If the folder wasn't deleted, check if app.yaml/app.yml still exists
+                naming_config = deleted_config or self.find_app_yaml(folder_path)
+
+            # Track deleted containers (Dockerfiles)
+            for dockerfile_path in deleted_items['dockerfiles']:
+                dockerfile = DockerfileInfo.from_path(dockerfile_path)
+                deleted_containers.append(Container(
+                    path=path,
+                    context=path,
+                    app_name=app_name,
+                    dockerfile=dockerfile,
+                    container_name=self.get_container_name(app_name, dockerfile, naming_config)
+                ))
+
+        return deleted_apps, deleted_containers
+
+    def analyze_folder(self, folder: Path) -> Optional[App]:
         """Analyze a folder for Dockerfiles and optionally app configuration"""
         dockerfiles = self.find_dockerfiles(folder)
         app_config = self.find_app_yaml(folder)
@@ -313,53 +335,25 @@ class BuildScopeAnalyzer:
             return None
 
         # Use folder name as app name
+        path = sys.intern(str(folder))
         app_name = folder.name
 
-        return {
-            'path': str(folder),
-            'app_name': app_name,
-            'app_config': app_config,  # Can be None
-            'dockerfiles': dockerfiles,  # Can be empty
-            'changed_files': [str(f) for f in changed_files]
-        }
-
-    def find_app_folders(self) -> Dict[str, Any]:
-        """Find folders containing changed files and analyze them"""
-        self.changed_files, self.deleted_files, self.renamed_files = self.get_changed_files()
+        containers = [
+            Container(
+                path=path,
+                context=self.get_dockerfile_context(dockerfile.path, path),
+                app_name=app_name,
+                dockerfile=dockerfile,
+                container_name=self.get_container_name(app_name, dockerfile, app_config)
+            )
+            for dockerfile in dockerfiles
+        ]
 
-        # Group files by their parent directories
-        changed_folders: Dict[Path, Set[Path]] = {}
+        return App(path, app_name, app_config, containers)
 
-        for file_path in self.changed_files:
-            if self.should_include_path(file_path):
-                folder = file_path.parent
-                if folder not in changed_folders:
-                    changed_folders[folder] = set()
-                changed_folders[folder].add(file_path)
-
-        # Analyze each folder
-        apps = {}
-        for folder, files in changed_folders.items():
-            app_info = self.analyze_folder(folder, files)
-            if app_info:
-                apps[folder] = app_info
-
-        # Get comparison ref and commit SHA
-        ref_name, commit_sha = self.get_comparison_ref()
-
-        # Analyze deletions
-        deletions = self.analyze_deletions()
-
-        return {
-            'apps': apps,
-            'deletions': deletions,
-            'ref': ref_name,
-            'commit_sha': commit_sha
-        }
-
-    def analyze_all_builds(self) -> List[Dict]:
-        """Analyze all apps in the include pattern, regardless of changes"""
-        all_apps = []
+    def find_scope_folders(self) -> List[Path]:
+        """Find all candidate app folders in the include pattern, regardless of changes"""
+        folders = []
 
         # If we have an include pattern like "apps/*", we need to find matching directories
         if self.include_pattern:
@@ -378,153 +372,84 @@ class BuildScopeAnalyzer:
                         if path.is_dir():
                             relative_path = path.relative_to(self.root_path)
                             if self.should_include_path(relative_path):
-                                app_info = self.analyze_folder(relative_path, set())
-                                if app_info:
-                                    # Use the same structure as the main matrix
-                                    item = {
-                                        'path': app_info['path'],
-                                        'app_name': app_info['app_name'],
-                                        'dockerfiles': app_info['dockerfiles']
-                                    }
-                                    if app_info['app_config']:
-                                        item['app_config'] = app_info['app_config']
-                                    all_apps.append(item)
+                                folders.append(relative_path)
             else:
                 # Pattern is a specific directory
                 specific_dir = self.root_path / self.include_pattern
                 if specific_dir.exists() and specific_dir.is_dir():
-                    relative_path = specific_dir.relative_to(self.root_path)
-                    app_info = self.analyze_folder(relative_path, set())
-                    if app_info:
-                        # Use the same structure as the main matrix
-                        item = {
-                            'path': app_info['path'],
-                            'app_name': app_info['app_name'],
-                            'dockerfiles': app_info['dockerfiles']
-                        }
-                        if app_info['app_config']:
-                            item['app_config'] = app_info['app_config']
-                        all_apps.append(item)
+                    folders.append(specific_dir.relative_to(self.root_path))
         else:
             # No include pattern, check all directories at root level
             for path in self.root_path.iterdir():
                 if path.is_dir() and not path.name.startswith('.'):
                     relative_path = path.relative_to(self.root_path)
                     if self.should_include_path(relative_path):
-                        app_info = self.analyze_folder(relative_path, set())
-                        if app_info:
-                            # Use the same structure as the main matrix
-                            item = {
-                                'path': app_info['path'],
-                                'app_name': app_info['app_name'],
-                                'dockerfiles': app_info['dockerfiles']
-                            }
-                            if app_info['app_config']:
-                                item['app_config'] = app_info['app_config']
-                            all_apps.append(item)
-
-        return all_apps
+                        folders.append(relative_path)
+
+        return folders
+
+    def build_inventory(self) -> Inventory:
+        """Analyze every relevant folder once and record what changed and what was deleted"""
+        ref_name, commit_sha = self.get_comparison_ref()
+        self.changed_files, self.deleted_files, self.renamed_files = self.get_changed_files(ref_name)
+
+        # All apps in the include pattern (for workflow_dispatch scenarios)
+        apps: Dict[str, App] = {}
+        for folder in self.find_scope_folders():
+            app = self.analyze_folder(folder)
+            if app:
+                app.in_scope = True
+                apps[app.path] = app
+
+        # Group changed files by their parent directories
+        changed_folders: Dict[Path, List[str]] = {}
+        for file_path in self.changed_files:
+            if self.should_include_path(file_path):
+                changed_folders.setdefault(file_path.parent, []).append(sys.intern(str(file_path)))
+
+        # Folders touched by a rename that also counts as a real file change
+        renamed_with_changes: Set[Path] = set()
+        for old, new in self.renamed_files.items():
+            if new in self.changed_files or old in self.changed_files:
+                renamed_with_changes.update((old.parent, new.parent))
+
+        for folder, files in changed_folders.items():
+            app = apps.get(str(folder)) or self.analyze_folder(folder)
+            if not app:
+                continue
+            apps[app.path] = app
+            app.changed_files = tuple(files)
+            # Only include if the folder is changed and not just renamed
+            only_renamed = bool(self.renamed_files) and folder not in renamed_with_changes
+            app.updated = not only_renamed
+
+        deleted_apps, deleted_containers = self.analyze_deletions()
+
+        return Inventory(
+            apps=apps,
+            deleted_apps=deleted_apps,
+            deleted_containers=deleted_containers,
+            ref=ref_name,
+            commit_sha=commit_sha
+        )
 
     def generate_matrix_output(self) -> Dict:
         """Generate output suitable for GitHub Actions matrix"""
-        analysis = self.find_app_folders()
-        changed_files = self.changed_files
-        renamed_files = self.renamed_files
-
-        # Helper to check if a folder is only renamed (no real file changes)
-        def is_only_renamed(folder: Path) -> bool:
-            # If all files in this folder are only in renamed_files, and not in changed_files
-            for old, new in renamed_files.items():
-                if new.parent == folder or old.parent == folder:
-                    # If the file is not in changed_files, it's only renamed
-                    if new not in changed_files and old not in changed_files:
-                        continue
-                    else:
-                        return False
-            return True if renamed_files else False
-
-        # Process changed apps
-        updated_apps = []  # Folders with app.yaml/app.yml
-        container_items = []  # Folders with Dockerfiles
-
-        for folder, app_info in analysis['apps'].items():
-            folder_path = Path(app_info['path'])
-            # Only include if any file in folder or subfolders is changed and not just renamed
-            if app_info['app_config']:
-                if self.folder_has_changes(folder_path, changed_files) and not is_only_renamed(folder_path):
-                    app_item = {
-                        'path': app_info['path'],
-                        'app_name': app_info['app_name'],
-                        'app_config': app_info['app_config']
-                    }
-                    updated_apps.append(app_item)
-
-            # Handle Dockerfiles (containers matrix)
-            if app_info['dockerfiles'] and len(app_info['dockerfiles']) > 0:
-                for dockerfile in app_info['dockerfiles']:
-                    if self.folder_has_changes(folder_path, changed_files) and not is_only_renamed(folder_path):
-                        container_name = self.get_container_name(app_info['app_name'], dockerfile, app_info['app_config'])
-                        context = self.get_dockerfile_context(dockerfile['path'], app_info['path'])
-                        suffix = dockerfile.get('suffix', '')
-                        container_item = {
-                            'path': app_info['path'],
-                            'context': context,
-                            'app_name': app_info['app_name'],
-                            'dockerfile': dockerfile,
-                            'container_name': container_name
-                        }
-                        container_items.append(container_item)
-
-        # Process all apps (for workflow_dispatch scenarios)
-        all_builds = self.analyze_all_builds()
-
-        # Split into app configs and containers
-        all_apps = []  # All folders with app.yaml/app.yml
-        all_containers = []  # All Dockerfiles
-
-        for app in all_builds:
-            if app.get('app_config'):
-                app_item = {
-                    'path': app['path'],
-                    'app_name': app['app_name'],
-                    'app_config': app['app_config']
-                }
-                all_apps.append(app_item)
-            if app.get('dockerfiles') and len(app['dockerfiles']) > 0:
-                for dockerfile in app['dockerfiles']:
-                    container_name = self.get_container_name(app['app_name'], dockerfile, app.get('app_config'))
-                    context = self.get_dockerfile_context(dockerfile['path'], app['path'])
-                    suffix = dockerfile.get('suffix', '')
-                    container_item = {
-                        'path': app['path'],
-                        'context': context,
-                        'app_name': app['app_name'],
-                        'dockerfile': dockerfile,
-                        'container_name': container_name
-                    }
-                    all_containers.append(container_item)
-
-        # Check if there are updated or deleted apps/containers
-        has_app_updates = len(updated_apps) > 0
-        has_app_deletions = len(analysis['deletions']['apps']) > 0
-        has_container_updates = len(container_items) > 0
-        has_container_deletions = len(analysis['deletions']['containers']) > 0
-
-        # Get the commit SHA for deleted items
-        commit_sha = analysis.get('commit_sha')
+        inventory = self.build_inventory()
+        commit_sha = inventory.commit_sha
 
-        # Add commit SHA to each deleted app and container if available
-        deleted_apps = analysis['deletions']['apps']
-        deleted_containers = analysis['deletions']['containers']
+        # Compute the updated and all views from the same app records
+        updated = [app for app in inventory.apps.values() if app.updated]
+        in_scope = [app for app in inventory.apps.values() if app.in_scope]
 
-        if commit_sha:
-            # Add to deleted apps
-            for app in deleted_apps:
-                app['commit_sha'] = commit_sha
+        updated_apps = [app.to_matrix_item() for app in updated if app.app_config]
+        container_items = [container.to_matrix_item() for app in updated for container in app.containers]
+        all_apps = [app.to_matrix_item() for app in in_scope if app.app_config]
+        all_containers = [container.to_matrix_item() for app in in_scope for container in app.containers]
 
-            # Add to deleted containers
-            for container in deleted_containers:
-                container['commit_sha'] = commit_sha
+        # Add commit SHA to each deleted app and container if available
+        deleted_apps = [app.to_matrix_item(commit_sha) for app in inventory.deleted_apps]
+        deleted_containers = [container.to_deleted_item(commit_sha) for container in inventory.deleted_containers]
 
         # Create the clean, focused return object
         return {
@@ -532,43 +457,35 @@ class BuildScopeAnalyzer:
                 'updated': updated_apps,  # Folders with app.yaml/app.yml that changed
                 'all': all_apps,       # All folders with app.yaml/app.yml
                 'deleted': deleted_apps,  # Deleted app.yaml/app.yml files
-                'has_updates': has_app_updates,
-                'has_deletions': has_app_deletions
+                'has_updates': len(updated_apps) > 0,
+                'has_deletions': len(deleted_apps) > 0
             },
             'containers': {
                 'updated': container_items,  # Changed Dockerfiles
                 'all': all_containers,       # All Dockerfiles
-                'deleted': analysis['deletions']['containers'],  # Deleted Dockerfiles
-                'has_updates': has_container_updates,
-                'has_deletions': has_container_deletions
+                'deleted': deleted_containers,  # Deleted Dockerfiles
+                'has_updates': len(container_items) > 0,
+                'has_deletions': len(deleted_containers) > 0
             },
-            'ref': analysis['ref']
+            'ref': inventory.ref
         }
 
-    def folder_has_changes(self, folder: Path, changed_files: Set[Path]) -> bool:
-        """Check if any file in folder or its subfolders is in changed_files"""
-        folder_abs = (self.root_path / folder).resolve()
-        for changed_file in changed_files:
-            changed_abs = (self.root_path / changed_file).resolve()
-            try:
-                changed_abs.relative_to(folder_abs)
-                return True
-            except ValueError:
-                continue
-        return False
-
     def get_app_name_from_yaml(self, app_yaml_path: Optional[str]) -> Optional[str]:
         """Extract the 'name' property from app.yaml/app.yml if present"""
         if not app_yaml_path:
             return None
+        if app_yaml_path in self._yaml_names:
+            return self._yaml_names[app_yaml_path]
+        name = None
         try:
             with open(self.root_path / app_yaml_path, 'r') as f:
                 data = yaml.safe_load(f)
                 if isinstance(data, dict) and 'name' in data:
-                    return str(data['name'])
+                    name = str(data['name'])
         except Exception:
             pass
-        return None
+        self._yaml_names[app_yaml_path] = name
+        return name
 
     def get_dockerfile_context(self, dockerfile_path: str, default_context: str) -> str:
         """Read the Dockerfile and extract a custom context if specified via # @context: ..."""
@@ -584,10 +501,10 @@ class BuildScopeAnalyzer:
             pass
         return default_context
 
-    def get_container_name(self, app_name: str, dockerfile: Dict[str, str], app_config: Optional[str] = None) -> str:
+    def get_container_name(self, app_name: str, dockerfile: DockerfileInfo, app_config: Optional[str] = None) -> str:
         # Try to get name from app.yaml/app.yml first if available
         base_name = self.get_app_name_from_yaml(app_config) or app_name
-        suffix = dockerfile.get('suffix', '')
+        suffix = dockerfile.suffix
         container_name = base_name if not suffix else f"{base_name}-{suffix}"
         # Ensure container name is lowercase for Azure Container Registry compatibility
         return container_name.lower()